@@ -12,46 +12,97 @@ FINAL PPTX → HTML TABLE CONVERTER (CLASS-BASED)
 """
 
 import os
-import tempfile
 import logging
-import html
 import re
-from flask import Flask, request, jsonify
+import json
+import hashlib
+import colorsys
+import posixpath
+import zipfile
+from io import BytesIO
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from flask import Flask, Response, request, jsonify, stream_with_context
 from flask_cors import CORS
-from pptx import Presentation
+from flask_compress import Compress
+from pptx.enum.dml import MSO_COLOR_TYPE, MSO_FILL, MSO_THEME_COLOR
 from pptx.enum.text import PP_ALIGN
 from pptx.oxml import parse_xml
+from pptx.table import Table
+from lxml import etree
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 
 # ------------------------------------------------------------------
 # FALLBACK THEME COLORS
 # ------------------------------------------------------------------
+# Keyed like the theme's clrScheme children (resolve_color maps tx1/bg1 etc.)
 THEME_COLOR_MAP = {
-    "ACCENT1": "#4472C4", "ACCENT_1": "#4472C4",
-    "ACCENT2": "#ED7D31", "ACCENT_2": "#ED7D31",
-    "ACCENT3": "#A5A5A5", "ACCENT_3": "#A5A5A5",
-    "ACCENT4": "#FFC000", "ACCENT_4": "#FFC000",
-    "ACCENT5": "#5B9BD5", "ACCENT_5": "#5B9BD5",
-    "ACCENT6": "#70AD47", "ACCENT_6": "#70AD47",
-    "TEXT1": "#000000", "TEXT_1": "#000000",
-    "TEXT2": "#FFFFFF", "TEXT_2": "#FFFFFF",
-    "BACKGROUND1": "#FFFFFF", "BACKGROUND_1": "#FFFFFF",
-    "BACKGROUND2": "#000000", "BACKGROUND_2": "#000000",
+    "ACCENT1": "#4472C4",
+    "ACCENT2": "#ED7D31",
+    "ACCENT3": "#A5A5A5",
+    "ACCENT4": "#FFC000",
+    "ACCENT5": "#5B9BD5",
+    "ACCENT6": "#70AD47",
+    "DK1": "#000000",
+    "DK2": "#44546A",
+    "LT1": "#FFFFFF",
+    "LT2": "#E7E6E6",
 }
 
 # ------------------------------------------------------------------
 # CSS REGISTRY (PER REQUEST)
 # ------------------------------------------------------------------
-GENERATED_CSS = set()
+# Each conversion builds its own registry (selector -> rule) so concurrent
+# requests never share state; insertion order keeps the output stable.
+STATIC_CSS = {
+    ".ppt-table": ".ppt-table { border-collapse:collapse;width:100%;font-size:14px; }",
+    ".ppt-table ul": ".ppt-table ul { margin:0 0 0 18px;padding:0; }",
+    ".ppt-cell": ".ppt-cell { border:1px solid #999;padding:6px;vertical-align:middle; }",
+    ".align-left": ".align-left { text-align:left; }",
+    ".align-center": ".align-center { text-align:center; }",
+    ".align-right": ".align-right { text-align:right; }",
+}
+
+
+def new_css_registry():
+    return dict(STATIC_CSS)
+
 
 # ------------------------------------------------------------------
 # HELPERS
 # ------------------------------------------------------------------
+class _SanitizeTable(dict):
+    # ASCII letters/digits map to themselves; everything else becomes "-"
+    def __missing__(self, codepoint):
+        return "-"
+
+
+_SANITIZE_TABLE = _SanitizeTable(
+    (c, c if chr(c).isalnum() else "-") for c in range(128)
+)
+_DASH_RUN_RE = re.compile(r"-{2,}")
+
+
+@lru_cache(maxsize=1024)
 def sanitize(s, maxlen=40):
     if not s:
         return ""
-    return re.sub(r"[^a-zA-Z0-9]+", "-", s).strip("-").lower()[:maxlen]
+    s = _DASH_RUN_RE.sub("-", s.translate(_SANITIZE_TABLE))
+    return s.strip("-").lower()[:maxlen]
+
+
+_ESC_RE = re.compile(r'[&<>"]')
+_ESC_MAP = {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"}
+
+
+def fast_escape(s):
+    # Most cells are plain text: skip the substitution when nothing matches.
+    # Single quotes are left alone; output only uses double-quoted attributes.
+    if not _ESC_RE.search(s):
+        return s
+    return _ESC_RE.sub(lambda m: _ESC_MAP[m.group(0)], s)
 
 
 def rgb_to_hex(rgb):
@@ -61,29 +112,71 @@ def rgb_to_hex(rgb):
         return None
 
 
-def add_css(selector, body):
-    GENERATED_CSS.add(f"{selector} {{ {body} }}")
+def apply_brightness(hex_color, brightness):
+    """Tint (> 0) or shade (< 0) a color the way PowerPoint's lumMod/lumOff do."""
+    if not hex_color or not brightness:
+        return hex_color
+    r, g, b = (int(hex_color[i:i + 2], 16) / 255 for i in (1, 3, 5))
+    h, l, s = colorsys.rgb_to_hls(r, g, b)
+    if brightness > 0:
+        l = l * (1 - brightness) + brightness
+    else:
+        l = l * (1 + brightness)
+    return rgb_to_hex([round(c * 255) for c in colorsys.hls_to_rgb(h, l, s)])
+
+
+def css_rule(selector, body):
+    return (selector, f"{selector} {{ {body} }}")
+
+
+def register(css, generated):
+    """Record the rules of a generator result in `css`, return its classes."""
+    classes, rules = generated
+    css.update(rules)
+    return classes
 
 
 # ------------------------------------------------------------------
 # THEME EXTRACTION
 # ------------------------------------------------------------------
-def extract_theme_colors(prs):
+A_NS = {"a": "http://schemas.openxmlformats.org/drawingml/2006/main"}
+_CLR_SCHEME_XPATH = etree.XPath(".//a:clrScheme", namespaces=A_NS)
+# dk1/lt1 are usually sysClr; lastClr holds the resolved hex
+_SCHEME_HEX_XPATH = etree.XPath("a:srgbClr/@val | a:sysClr/@lastClr", namespaces=A_NS)
+_BUCHAR_XPATH = etree.XPath(".//a:buChar", namespaces=A_NS)
+
+
+@lru_cache(maxsize=32)
+def _theme_colors_from_blob(blob):
     theme = {}
     try:
-        root = parse_xml(prs.part.theme_part.blob)
-        scheme = root.find(".//a:clrScheme", root.nsmap)
-        if scheme is not None:
-            for el in scheme:
-                key = el.tag.split("}")[-1].upper()
-                srgb = el.find(".//a:srgbClr", root.nsmap)
-                if srgb is not None:
-                    theme[key] = "#" + srgb.get("val")
+        root = parse_xml(blob)
+        schemes = _CLR_SCHEME_XPATH(root)
+        if schemes:
+            for el in schemes[0]:
+                key = el.tag.rpartition("}")[2].upper()
+                val = _SCHEME_HEX_XPATH(el)
+                if val:
+                    theme[key] = "#" + val[0].upper()
     except Exception:
         pass
 
     for k, v in THEME_COLOR_MAP.items():
-        theme.setdefault(k.upper(), v)
+        theme.setdefault(k, v)
+
+    return theme
+
+
+def extract_theme_colors(blob, clr_map=None):
+    # Cached per theme blob: decks built from the same template share it
+    theme = dict(_theme_colors_from_blob(blob or b""))
+
+    # tx1/bg1/tx2/bg2 only mean something through the master's clrMap
+    # (dark templates swap them); without one they are left unresolved
+    for alias, target in (clr_map or {}).items():
+        hexc = theme.get(target.upper())
+        if hexc:
+            theme[alias.upper()] = hexc
 
     return theme
 
@@ -91,215 +184,341 @@ def extract_theme_colors(prs):
 # ------------------------------------------------------------------
 # CSS CLASS GENERATORS
 # ------------------------------------------------------------------
+# Generators are pure and cached per unique input. Each returns
+# (classes, rules); callers pass that through register() for their request.
+@lru_cache(maxsize=256)
 def bg_classes(hex_color, semantic=None):
     if not hex_color:
-        return []
+        return (), ()
     key = hex_color[1:].upper()
     cls_hex = f"bg-{key}"
-    add_css(f".{cls_hex}", f"background-color:{hex_color};")
+    rule_hex = css_rule(f".{cls_hex}", f"background-color:{hex_color};")
 
-    classes = [cls_hex]
     if semantic:
         cls_sem = f"bg-{sanitize(semantic)}"
-        add_css(f".{cls_sem}", f"background-color:{hex_color};")
-        classes.insert(0, cls_sem)
+        rule_sem = css_rule(f".{cls_sem}", f"background-color:{hex_color};")
+        return (cls_sem, cls_hex), (rule_hex, rule_sem)
 
-    return classes
+    return (cls_hex,), (rule_hex,)
 
 
+@lru_cache(maxsize=256)
 def text_color_class(hex_color):
     if not hex_color:
-        return []
+        return (), ()
     cls = f"text-{hex_color[1:].upper()}"
-    add_css(f".{cls}", f"color:{hex_color};")
-    return [cls]
+    return (cls,), (css_rule(f".{cls}", f"color:{hex_color};"),)
 
 
+@lru_cache(maxsize=256)
 def font_family_class(name):
     if not name:
-        return []
+        return (), ()
     cls = f"ff-{sanitize(name)}"
-    add_css(f".{cls}", f"font-family:'{name}';")
-    return [cls]
+    return (cls,), (css_rule(f".{cls}", f"font-family:'{name}';"),)
 
 
+@lru_cache(maxsize=256)
 def font_size_class(pt):
     if not pt:
-        return []
+        return (), ()
     cls = f"fs-{int(pt)}"
-    add_css(f".{cls}", f"font-size:{int(pt)}pt;")
-    return [cls]
+    return (cls,), (css_rule(f".{cls}", f"font-size:{int(pt)}pt;"),)
 
 
 # ------------------------------------------------------------------
 # RUN / PARAGRAPH / CELL TO HTML
 # ------------------------------------------------------------------
-def run_to_html(run, theme):
-    text = html.escape(run.text or "")
-    if not text:
+def resolve_color(fc, theme):
+    """
+    Return (hex, theme color name) for a ColorFormat; either may be None.
+    Checks fc.type first since .rgb / .theme_color raise on other types.
+    Scheme colors are looked up by their clrScheme key (ACCENT1, DK1, ...);
+    TX1/BG1 etc. are only present when the deck's clrMap was read.
+    """
+    ctype = fc.type
+    if ctype == MSO_COLOR_TYPE.RGB:
+        return rgb_to_hex(fc.rgb), None
+    if ctype == MSO_COLOR_TYPE.SCHEME:
+        try:
+            name = MSO_THEME_COLOR.to_xml(fc.theme_color)
+        except (KeyError, ValueError):
+            # e.g. phClr, which only has meaning inside a style matrix
+            return None, None
+        hexc = theme.get(name.upper())
+        brightness = fc.brightness
+        if brightness:
+            # Tinted/shaded swatch ("Accent 2, Lighter 80%"): only the hex
+            # class, so it never shares the bg-accent2 rule with the real one
+            return apply_brightness(hexc, brightness), None
+        return hexc, name.lower()
+    return None, None
+
+
+def run_to_html(run, theme, css):
+    raw = run.text
+    if not raw:
         return ""
+    text = fast_escape(raw)
 
-    classes = []
-
-    try:
-        fc = run.font.color
-        if fc:
-            if fc.rgb:
-                classes += text_color_class(rgb_to_hex(fc.rgb))
-            elif fc.theme_color:
-                key = str(fc.theme_color).split(".")[-1].upper()
-                classes += text_color_class(theme.get(key))
-    except:
-        pass
+    font = run.font
+    hexc, _ = resolve_color(font.color, theme)
+    classes = list(register(css, text_color_class(hexc)))
+    classes += register(css, font_family_class(font.name))
 
-    try:
-        classes += font_family_class(run.font.name)
-    except:
-        pass
-
-    try:
-        if run.font.size:
-            classes += font_size_class(run.font.size.pt)
-    except:
-        pass
+    size = font.size
+    if size:
+        classes += register(css, font_size_class(size.pt))
 
+    # Color / family / size generators use distinct prefixes, so no dedupe
     span = text
     if classes:
-        span = f'<span class="{" ".join(dict.fromkeys(classes))}">{text}</span>'
-
-    if run.font.bold:
-        span = f"<b>{span}</b>"
-    if run.font.italic:
-        span = f"<i>{span}</i>"
-    if run.font.underline:
-        span = f"<u>{span}</u>"
-
-    return span
-
-
-def para_to_html(p, theme):
-    parts = [run_to_html(r, theme) for r in p.runs]
+        span = f'<span class="{" ".join(classes)}">{text}</span>'
+
+    # Nesting is <u><i><b>...</b></i></u>; join once instead of rewrapping
+    open_tags = []
+    close_tags = []
+    if font.bold:
+        open_tags.append("<b>")
+        close_tags.append("</b>")
+    if font.italic:
+        open_tags.append("<i>")
+        close_tags.append("</i>")
+    if font.underline:
+        open_tags.append("<u>")
+        close_tags.append("</u>")
+
+    if not open_tags:
+        return span
+    return "".join(reversed(open_tags)) + span + "".join(close_tags)
+
+
+def para_to_html(p, theme, css):
+    runs = p.runs
+    if not runs:
+        return ""
+    parts = [run_to_html(r, theme, css) for r in runs]
     content = "".join(parts).strip()
     if not content:
         return ""
 
     # Bullet detection
-    try:
-        if p.level > 0:
-            return f"<li>{content}</li>"
-        ppr = p._pPr
-        if ppr is not None and ppr.find(".//a:buChar", p._element.nsmap) is not None:
-            return f"<li>{content}</li>"
-    except:
-        pass
+    if p.level > 0:
+        return f"<li>{content}</li>"
+    ppr = p._pPr
+    if ppr is not None and _BUCHAR_XPATH(ppr):
+        return f"<li>{content}</li>"
 
     return content
 
 
-def cell_content(cell, theme):
-    items = [para_to_html(p, theme) for p in cell.text_frame.paragraphs]
-    items = [i for i in items if i]
+@dataclass(slots=True)
+class CellSpec:
+    classes: str
+    content: str
+    colspan: int = 1
+    rowspan: int = 1
 
-    if not items:
-        return ""
-
-    if any(i.startswith("<li>") for i in items):
-        return "<ul>" + "".join(items) + "</ul>"
-
-    return "<br/>".join(items)
 
-
-def cell_classes(cell, theme):
+def render_cell(cell, theme, css):
+    """Build the CellSpec for a cell, reading its paragraphs once."""
+    paras = cell.text_frame.paragraphs
     classes = ["ppt-cell"]
 
-    # Background
-    try:
-        fc = cell.fill.fore_color
-        hexc = None
-        semantic = None
-
-        if fc.rgb:
-            hexc = rgb_to_hex(fc.rgb)
-        elif fc.theme_color:
-            semantic = str(fc.theme_color).split(".")[-1].lower()
-            hexc = theme.get(semantic.upper())
-
+    # Background; fore_color raises for fills other than solid / patterned
+    fill = cell.fill
+    if fill.type in (MSO_FILL.SOLID, MSO_FILL.PATTERNED):
+        hexc, semantic = resolve_color(fill.fore_color, theme)
         if hexc:
-            classes += bg_classes(hexc, semantic)
-    except:
-        pass
+            classes += register(css, bg_classes(hexc, semantic))
 
     # Alignment
-    try:
-        align = cell.text_frame.paragraphs[0].alignment
-        if align == PP_ALIGN.CENTER:
-            classes.append("align-center")
-            add_css(".align-center", "text-align:center;")
-        elif align == PP_ALIGN.RIGHT:
-            classes.append("align-right")
-            add_css(".align-right", "text-align:right;")
-        else:
-            classes.append("align-left")
-            add_css(".align-left", "text-align:left;")
-    except:
+    align = paras[0].alignment if paras else None
+    if align == PP_ALIGN.CENTER:
+        classes.append("align-center")
+    elif align == PP_ALIGN.RIGHT:
+        classes.append("align-right")
+    else:
         classes.append("align-left")
-        add_css(".align-left", "text-align:left;")
 
-    add_css(".ppt-cell", "border:1px solid #999;padding:6px;vertical-align:middle;")
+    # ppt-cell, bg-* and align-* never overlap, so no dedupe is needed
+    classes = " ".join(classes)
+
+    # Content
+    items = [i for i in (para_to_html(p, theme, css) for p in paras) if i]
 
-    return " ".join(dict.fromkeys(classes))
+    if not items:
+        content = ""
+    elif any(i.startswith("<li>") for i in items):
+        content = "<ul>" + "".join(items) + "</ul>"
+    else:
+        content = "<br/>".join(items)
+
+    return CellSpec(
+        classes,
+        content,
+        getattr(cell, "span_width", 1),
+        getattr(cell, "span_height", 1),
+    )
 
 
 # ------------------------------------------------------------------
 # TABLE PROCESSING
 # ------------------------------------------------------------------
-def process_table(table, theme):
+def process_table(table, theme, css):
     rows = []
 
-    for r in range(len(table.rows)):
+    # Walk rows/cells in one pass; table.cell(r, c) re-scans the XML per call
+    for row in table.rows:
         cols = []
-        for c in range(len(table.columns)):
-            cell = table.cell(r, c)
-
+        for cell in row.cells:
             if getattr(cell, "is_spanned", False):
                 continue
 
-            content = cell_content(cell, theme)
-            classes = cell_classes(cell, theme)
-
-            colspan = getattr(cell, "span_width", 1)
-            rowspan = getattr(cell, "span_height", 1)
-
-            cols.append(
-                f'<td colspan="{colspan}" rowspan="{rowspan}" class="{classes}">{content}</td>'
-            )
+            s = render_cell(cell, theme, css)
+            # colspan/rowspan default to 1, so only merged cells carry them
+            if s.colspan == 1 and s.rowspan == 1:
+                cols.append(f'<td class="{s.classes}">{s.content}</td>')
+            else:
+                cols.append(
+                    f'<td colspan="{s.colspan}" rowspan="{s.rowspan}" class="{s.classes}">{s.content}</td>'
+                )
 
         rows.append("<tr>" + "".join(cols) + "</tr>")
 
-    add_css(".ppt-table", "border-collapse:collapse;width:100%;font-size:14px;")
-    add_css(".ppt-table ul", "margin:0 0 0 18px;padding:0;")
-
     return "\n".join(rows)
 
 
 # ------------------------------------------------------------------
-# MAIN CONVERTER (IMPORTANT: CLEAR CSS ONCE HERE)
+# PACKAGE SCAN (ONLY THE PARTS WE NEED)
 # ------------------------------------------------------------------
-def pptx_to_html(path):
-    GENERATED_CSS.clear()
-
-    prs = Presentation(path)
-    theme = extract_theme_colors(prs)
-    blocks = []
+P_NS = {
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+}
+PKG_REL_NS = {"pr": "http://schemas.openxmlformats.org/package/2006/relationships"}
+RT_OFFICE_DOCUMENT = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+)
+RT_THEME = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/theme"
+
+_SLD_RID_XPATH = etree.XPath("p:sldIdLst/p:sldId/@r:id", namespaces=P_NS)
+_MASTER_RID_XPATH = etree.XPath("p:sldMasterIdLst/p:sldMasterId/@r:id", namespaces=P_NS)
+_CLR_MAP_XPATH = etree.XPath("p:clrMap", namespaces=P_NS)
+CLR_MAP_ALIASES = ("tx1", "bg1", "tx2", "bg2")
+_REL_XPATH = etree.XPath("pr:Relationship", namespaces=PKG_REL_NS)
+_TBL_XPATH = etree.XPath(
+    "p:cSld/p:spTree/p:graphicFrame/a:graphic/a:graphicData/a:tbl",
+    namespaces={**A_NS, **P_NS},
+)
+
+
+def _part_rels(z, part_name):
+    """Return {rId: (type, part name)} for a part; "" is the package itself."""
+    base, filename = posixpath.split(part_name)
+    rels = {}
+    rels_xml = z.read(posixpath.join(base, "_rels", filename + ".rels"))
+    for rel in _REL_XPATH(parse_xml(rels_xml)):
+        if rel.get("TargetMode") == "External":
+            continue
+        target = rel.get("Target")
+        # Targets are relative to the source part's directory unless absolute
+        if target.startswith("/"):
+            name = target[1:]
+        else:
+            name = posixpath.normpath(posixpath.join(base, target))
+        rels[rel.get("Id")] = (rel.get("Type"), name)
+    return rels
+
+
+def read_pptx(source):
+    """
+    Return (theme blob, clrMap dict, [slide XML]) with slides in
+    presentation order. Only the first slide master is read, for its
+    clrMap; layouts, media and other parts are never read or parsed.
+    """
+    with zipfile.ZipFile(source) as z:
+        # Locate the main part the way python-pptx does, via _rels/.rels
+        main = None
+        for rtype, name in _part_rels(z, "").values():
+            if rtype == RT_OFFICE_DOCUMENT:
+                main = name
+        if main is None:
+            raise ValueError("package has no officeDocument relationship")
+
+        rels = _part_rels(z, main)
+        theme = b""
+        for rtype, name in rels.values():
+            if rtype == RT_THEME:
+                theme = z.read(name)
+
+        pres = parse_xml(z.read(main))
+        slides = [z.read(rels[rid][1]) for rid in _SLD_RID_XPATH(pres)]
+
+        clr_map = {}
+        masters = _MASTER_RID_XPATH(pres)
+        if masters:
+            found = _CLR_MAP_XPATH(parse_xml(z.read(rels[masters[0]][1])))
+            if found:
+                clr_map = {k: found[0].get(k) for k in CLR_MAP_ALIASES if found[0].get(k)}
+
+    return theme, clr_map, slides
+
+
+def slide_tables(slide_xml):
+    # Top-level table frames only, same as iterating slide.shapes before.
+    # parse_xml yields python-pptx element classes, so Table works unparented.
+    return [Table(tbl, None) for tbl in _TBL_XPATH(parse_xml(slide_xml))]
 
-    for slide in prs.slides:
-        for shape in slide.shapes:
-            if shape.has_table:
-                body = process_table(shape.table, theme)
-                blocks.append(f"<table class='ppt-table'>{body}</table>")
 
-    css = "<style>\n" + "\n".join(GENERATED_CSS) + "\n</style>\n"
-    return css + "<br/>".join(blocks)
+# ------------------------------------------------------------------
+# MAIN CONVERTER (IMPORTANT: ONE CSS REGISTRY PER CALL)
+# ------------------------------------------------------------------
+def pptx_to_html(source):
+    """
+    Open the deck (a path or seekable file-like object) eagerly and return
+    a generator of HTML chunks. Bad packages or slide XML raise here,
+    before a response is started; only rendering happens mid-stream.
+    Tables are yielded as they are rendered; the <style> block comes last
+    because the CSS is only complete once every table has been seen.
+    """
+    theme_blob, clr_map, slides = read_pptx(source)
+    theme = extract_theme_colors(theme_blob, clr_map)
+    tables = [
+        (hashlib.sha1(etree.tostring(table._tbl)).digest(), table)
+        for slide_xml in slides
+        for table in slide_tables(slide_xml)
+    ]
+    return _html_chunks(theme, tables)
+
+
+def _html_chunks(theme, tables):
+    css = new_css_registry()
+    # Template decks repeat tables: keep a rendered body only while its
+    # digest still occurs later, so unique tables are never held in memory
+    remaining = Counter(key for key, _ in tables)
+    rendered = {}
+    sep = ""
+
+    for key, table in tables:
+        body = rendered.pop(key, None)
+        if body is None:
+            body = process_table(table, theme, css)
+        remaining[key] -= 1
+        if remaining[key]:
+            rendered[key] = body
+        yield f"{sep}<table class='ppt-table'>{body}</table>"
+        sep = "<br/>"
+
+    yield "\n<style>\n" + "\n".join(css.values()) + "\n</style>\n"
+
+
+def json_html_stream(chunks):
+    # Frames the chunks as {"html": "..."} without joining them in memory
+    yield '{"html": "'
+    for chunk in chunks:
+        yield json.dumps(chunk)[1:-1]
+    yield '"}'
 
 
 # ------------------------------------------------------------------
@@ -307,6 +526,9 @@ def pptx_to_html(path):
 # ------------------------------------------------------------------
 app = Flask(__name__)
 CORS(app)
+# HTML/CSS JSON compresses well; streamed /convert responses are compressed
+# chunk by chunk (br/deflate/zstd, per COMPRESS_ALGORITHM_STREAMING)
+Compress(app)
 
 @app.route("/")
 def home():
@@ -319,12 +541,12 @@ def convert():
     if not f:
         return jsonify({"error": "No file uploaded"}), 400
 
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".pptx") as tmp:
-        f.save(tmp.name)
-        html_out = pptx_to_html(tmp.name)
-
-    os.remove(tmp.name)
-    return jsonify({"html": html_out})
+    # Parse the upload in memory; python-pptx needs a seekable stream
+    chunks = pptx_to_html(BytesIO(f.read()))
+    return Response(
+        stream_with_context(json_html_stream(chunks)),
+        mimetype="application/json",
+    )
 
 
 if __name__ == "__main__":
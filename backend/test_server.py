@@ -0,0 +1,91 @@
+import json
+from io import BytesIO
+
+from pptx import Presentation
+from pptx.enum.dml import MSO_THEME_COLOR
+from pptx.oxml.ns import qn
+from pptx.util import Inches
+
+import server
+
+
+def add_table_slide(prs, texts):
+    slide = prs.slides.add_slide(prs.slide_layouts[5])
+    shape = slide.shapes.add_table(
+        1, len(texts), Inches(0.5), Inches(1.5), Inches(8), Inches(1)
+    )
+    for c, text in enumerate(texts):
+        shape.table.cell(0, c).text = text
+    return shape.table
+
+
+def save(prs):
+    buf = BytesIO()
+    prs.save(buf)
+    buf.seek(0)
+    return buf
+
+
+def convert(buf):
+    return "".join(server.pptx_to_html(buf))
+
+
+def test_slides_follow_sldIdLst_order():
+    prs = Presentation()
+    for name in ("first", "second", "third"):
+        add_table_slide(prs, [name])
+
+    # Move the last slide to the front; zip entry names stay slide1..3
+    sld_id_lst = prs.slides._sldIdLst
+    last = sld_id_lst[-1]
+    sld_id_lst.remove(last)
+    sld_id_lst.insert(0, last)
+
+    html = convert(save(prs))
+    positions = [html.index(name) for name in ("third", "first", "second")]
+    assert positions == sorted(positions)
+
+
+def test_theme_and_scheme_colors():
+    prs = Presentation()
+    table = add_table_slide(prs, ["accent", "tint", "text"])
+
+    accent = table.cell(0, 0)
+    accent.fill.solid()
+    accent.fill.fore_color.theme_color = MSO_THEME_COLOR.ACCENT_1
+
+    tint = table.cell(0, 1)
+    tint.fill.solid()
+    tint.fill.fore_color.theme_color = MSO_THEME_COLOR.ACCENT_2
+    tint.fill.fore_color.brightness = 0.8
+
+    run = table.cell(0, 2).text_frame.paragraphs[0].runs[0]
+    run.font.color.theme_color = MSO_THEME_COLOR.TEXT_1
+
+    # Default template theme: accent1 #4F81BD, accent2 #C0504D, dk1 black
+    html = convert(save(prs))
+    assert 'class="ppt-cell bg-accent1 bg-4F81BD align-left">accent' in html
+    assert 'class="ppt-cell bg-F2DCDB align-left">tint' in html
+    assert '<span class="text-000000">text</span>' in html
+
+    # Dark template: the master's clrMap maps tx1 to lt1
+    clr_map = prs.slide_masters[0]._element.find(qn("p:clrMap"))
+    clr_map.set("bg1", "dk1")
+    clr_map.set("tx1", "lt1")
+    assert '<span class="text-FFFFFF">text</span>' in convert(save(prs))
+
+
+def test_convert_json_round_trip():
+    prs = Presentation()
+    add_table_slide(prs, ['say "hi" \\ <b>', "héllo ✓"])
+    buf = save(prs)
+    expected = convert(BytesIO(buf.getvalue()))
+
+    client = server.app.test_client()
+    resp = client.post("/convert", data={"pptFile": (buf, "deck.pptx")})
+
+    assert resp.status_code == 200
+    html = json.loads(resp.data)["html"]
+    assert html == expected
+    assert "say &quot;hi&quot; \\ &lt;b&gt;" in html
+    assert "héllo ✓" in html